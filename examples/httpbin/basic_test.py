@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: basic.yml
+# DIGEST: ad1423892fd0439f
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
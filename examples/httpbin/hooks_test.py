@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: hooks.yml
+# DIGEST: f38ddfa6eb74595f
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: load_image.yml
+# DIGEST: 18111a8cfaa64cb8
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: upload.yml
+# DIGEST: 54f7542f642a555f
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: validate.yml
+# DIGEST: 034caead513b771e
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: request_methods/request_with_functions.yml
+# DIGEST: 8b1aa9c078637aa5
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: request_methods/request_with_testcase_reference.yml
+# DIGEST: 9c9b6899ae72fe83
 
 
 import sys
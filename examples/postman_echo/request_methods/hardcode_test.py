@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: request_methods/hardcode.yml
+# DIGEST: 163d14f60b28d212
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: request_methods/request_with_functions.yml
+# DIGEST: 019702ef2a9ef926
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: request_methods/request_with_parameters.yml
+# DIGEST: acb41b27ed3d3fa9
 
 
 import pytest
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: request_methods/request_with_testcase_reference.yml
+# DIGEST: 5eb1e4b795b9e3bb
 
 
 import sys
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: request_methods/request_with_variables.yml
+# DIGEST: da927bd6502fa2e8
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
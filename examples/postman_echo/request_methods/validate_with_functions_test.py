@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: request_methods/validate_with_functions.yml
+# DIGEST: 1cb89dd691b2c13f
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
@@ -1,5 +1,6 @@
 # NOTE: Generated By HttpRunner v3.1.4
 # FROM: request_methods/validate_with_variables.yml
+# DIGEST: 24a9f4d63b612e29
 
 
 from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
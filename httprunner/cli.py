@@ -120,7 +120,7 @@ def main():
     elif sys.argv[1] == "har2case":
         main_har2case(args)
     elif sys.argv[1] == "make":
-        main_make(args.testcase_path)
+        main_make(args.testcase_path, args.workers)
 
 
 def main_hrun_alias():
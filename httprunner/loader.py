@@ -1,10 +1,12 @@
+import copy
 import csv
 import importlib
 import json
 import os
 import sys
 import types
-from typing import Tuple, Dict, Union, Text, List, Callable
+from functools import lru_cache
+from typing import Tuple, Dict, Union, Text, List, Callable, Iterator
 
 import yaml
 from loguru import logger
@@ -21,6 +23,12 @@ try:
 except AttributeError:
     pass
 
+try:
+    # use libyaml C extension to speed up parsing if available
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 project_meta: Union[ProjectMeta, None] = None
 
@@ -30,7 +38,7 @@ def _load_yaml_file(yaml_file: Text) -> Dict:
     """
     with open(yaml_file, mode="rb") as stream:
         try:
-            yaml_content = yaml.load(stream)
+            yaml_content = yaml.load(stream, Loader=YamlLoader)
         except yaml.YAMLError as ex:
             err_msg = f"YAMLError:\nfile: {yaml_file}\nerror: {ex}"
             logger.error(err_msg)
@@ -52,6 +60,14 @@ def _load_json_file(json_file: Text) -> Dict:
         return json_content
 
 
+@lru_cache(maxsize=4096)
+def _load_yaml_file_with_cache(yaml_file: Text, mtime_ns: int) -> Dict:
+    """ load yaml file content, cached by file path and modification time,
+        thus file referenced by multiple testcases/testsuites will be parsed only once
+    """
+    return _load_yaml_file(yaml_file)
+
+
 def load_test_file(test_file: Text) -> Dict:
     """load testcase/testsuite file content"""
     if not os.path.isfile(test_file):
@@ -59,9 +75,15 @@ def load_test_file(test_file: Text) -> Dict:
 
     file_suffix = os.path.splitext(test_file)[1].lower()
     if file_suffix == ".json":
+        # json parsing is faster than deep copying cached content, thus not cached
         test_file_content = _load_json_file(test_file)
     elif file_suffix in [".yaml", ".yml"]:
-        test_file_content = _load_yaml_file(test_file)
+        test_file = os.path.abspath(test_file)
+        test_file_content = _load_yaml_file_with_cache(
+            test_file, os.stat(test_file).st_mtime_ns
+        )
+        # loaded content will be modified by callers, return a copy to keep cache intact
+        test_file_content = copy.deepcopy(test_file_content)
     else:
         # '' or other suffix
         raise exceptions.FileFormatError(
@@ -191,6 +213,35 @@ def load_csv_file(csv_file: Text) -> List[Dict]:
     return csv_content_list
 
 
+def iter_folder_files(folder_path: Text, recursive: bool = True) -> Iterator[Text]:
+    """ iterate folder path, yield files endswith .yml/.yaml/.json/_test.py.
+        os.scandir is used, thus file type of each entry is got without extra stat call.
+        files in a folder are yielded before its sub folders, same as os.walk.
+
+    Args:
+        folder_path (str): specified folder path to iterate
+        recursive (bool): iterate files recursively if True
+
+    """
+    test_file_suffixes = (".yml", ".yaml", ".json", "_test.py")
+    sub_folders = []
+    try:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # do not follow symbolic link to folder, same as os.walk
+                    if recursive and not entry.is_symlink():
+                        sub_folders.append(entry.path)
+                elif entry.name.lower().endswith(test_file_suffixes):
+                    yield entry.path
+    except OSError:
+        # folder not exists or permission denied
+        return
+
+    for sub_folder in sub_folders:
+        yield from iter_folder_files(sub_folder, recursive)
+
+
 def load_folder_files(folder_path: Text, recursive: bool = True) -> List:
     """ load folder path, return all files endswith .yml/.yaml/.json/_test.py in list.
 
@@ -208,28 +259,7 @@ def load_folder_files(folder_path: Text, recursive: bool = True) -> List:
 
         return files
 
-    if not os.path.exists(folder_path):
-        return []
-
-    file_list = []
-
-    for dirpath, dirnames, filenames in os.walk(folder_path):
-        filenames_list = []
-
-        for filename in filenames:
-            if not filename.lower().endswith((".yml", ".yaml", ".json", "_test.py")):
-                continue
-
-            filenames_list.append(filename)
-
-        for filename in filenames_list:
-            file_path = os.path.join(dirpath, filename)
-            file_list.append(file_path)
-
-        if not recursive:
-            break
-
-    return file_list
+    return list(iter_folder_files(folder_path, recursive))
 
 
 def load_module_functions(module) -> Dict[Text, Callable]:
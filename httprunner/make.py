@@ -1,8 +1,13 @@
+import ast
+import hashlib
+import itertools
+import multiprocessing
 import os
 import string
 import subprocess
 import sys
-from typing import Text, List, Tuple, Dict, Set, NoReturn
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Text, List, Tuple, Dict, Set, NoReturn, Iterable, Optional
 
 import jinja2
 from loguru import logger
@@ -16,7 +21,7 @@ from httprunner.compat import (
     ensure_path_sep,
 )
 from httprunner.loader import (
-    load_folder_files,
+    iter_folder_files,
     load_test_file,
     load_testcase,
     load_testsuite,
@@ -26,6 +31,13 @@ from httprunner.loader import (
 from httprunner.response import uniform_validator
 from httprunner.utils import merge_variables, is_support_multiprocessing
 
+try:
+    import black
+
+    BLACK_READY = True
+except ModuleNotFoundError:
+    BLACK_READY = False
+
 """ cache converted pytest files, avoid duplicate making
 """
 pytest_files_made_cache_mapping: Dict[Text, Text] = {}
@@ -34,25 +46,34 @@ pytest_files_made_cache_mapping: Dict[Text, Text] = {}
 """
 pytest_files_run_set: Set = set()
 
-__TEMPLATE__ = jinja2.Template(
-    """# NOTE: Generated By HttpRunner v{{ version }}
-# FROM: {{ testcase_path }}
+""" save pytest files written in current making run, only these files need formatting
+"""
+pytest_files_written_set: Set = set()
 
-{% if imports_list and diff_levels > 0 %}
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__){% for _ in range(diff_levels) %}.parent{% endfor %}))
-{% endif %}
+""" cache made referenced testcases, avoid loading and validating them repeatedly
+    ref testcase real path => (generated pytest file path, class name, ref testcase export)
+"""
+ref_testcases_made_cache_mapping: Dict[Text, Tuple[Text, Text, List]] = {}
 
-{% if parameters %}
-import pytest
-from httprunner import Parameters
-{% endif %}
+""" cache directories which have been ensured to be python module, avoid duplicate checking
+"""
+pytest_module_dirs_ensured_set: Set = set()
+
+""" make test files with process pool only if each worker gets at least so many YAML/JSON files,
+    spawning a worker costs about 0.3s while making a file costs about 1ms
+"""
+MIN_FILES_PER_MAKE_WORKER = 500
+
+""" static header of pytest file, rendered with str.format
+"""
+__TEMPLATE_HEADER__ = """# NOTE: Generated By HttpRunner v{version}
+# FROM: {testcase_path}
+# DIGEST: {digest}
+"""
 
-from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase
-{% for import_str in imports_list %}
-{{ import_str }}
-{% endfor %}
+""" pytest testcase class, only this part is rendered with jinja2
+"""
+__TEMPLATE_SOURCE__ = """
 
 class {{ class_name }}(HttpRunner):
 
@@ -74,7 +95,83 @@ if __name__ == "__main__":
     {{ class_name }}().test_start()
 
 """
+
+
+def __make_jinja_bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    """ cache compiled template bytecode on disk, thus later make processes can skip compiling.
+        directory defaults to jinja2's per-user cache directory, and can be specified
+        with environment variable HRUN_JINJA_CACHE. HttpRunner version is included in
+        cache file name, thus upgrading HttpRunner will not reuse stale bytecode.
+    """
+    cache_dir = os.environ.get("HRUN_JINJA_CACHE")
+    try:
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        return jinja2.FileSystemBytecodeCache(
+            directory=cache_dir, pattern=f"__httprunner_{__version__}_%s.cache"
+        )
+    except (OSError, RuntimeError) as ex:
+        logger.warning(f"jinja2 bytecode cache disabled: {ex}")
+        return None
+
+
+""" compile pytest template once with a dedicated jinja2 environment,
+    auto_reload is disabled because the template source never changes at runtime
+"""
+__JINJA_ENV__ = jinja2.Environment(
+    loader=jinja2.DictLoader({"testcase": __TEMPLATE_SOURCE__}),
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=__make_jinja_bytecode_cache(),
 )
+__TEMPLATE__ = __JINJA_ENV__.get_template("testcase")
+
+
+def __make_source_digest() -> bytes:
+    """ digest of pytest file making source, including templates and chain style makers,
+        thus changing them invalidates generated pytest files even without version bump
+    """
+    try:
+        with open(__file__, "rb") as f:
+            source = f.read()
+    except OSError:
+        source = f"{__TEMPLATE_HEADER__}{__TEMPLATE_SOURCE__}".encode("utf-8")
+
+    return hashlib.blake2b(source, digest_size=8).digest()
+
+
+__MAKE_SOURCE_DIGEST__ = __make_source_digest()
+
+
+""" replace dot/hyphen/space in file/directory name with underscore in one pass
+"""
+__FILE_NAME_TRANS_TABLE__ = str.maketrans({" ": "_", ".": "_", "-": "_"})
+
+
+def __make_pytest_header(data: Dict) -> Text:
+    """ make header and import statements of pytest file without jinja2,
+        blank lines are arranged as black does
+    """
+    sections = []
+    if data["imports_list"] and data["diff_levels"] > 0:
+        parents = ".parent" * data["diff_levels"]
+        sections.append(
+            "import sys\n"
+            "from pathlib import Path\n\n"
+            f"sys.path.insert(0, str(Path(__file__){parents}))\n"
+        )
+
+    if data["parameters"]:
+        sections.append("import pytest\nfrom httprunner import Parameters\n")
+
+    imports = "".join(f"\n{import_str}\n" for import_str in data["imports_list"])
+    sections.append(
+        "from httprunner import HttpRunner, Config, Step, RunRequest, RunTestCase\n"
+        f"{imports}"
+    )
+
+    return __TEMPLATE_HEADER__.format_map(data) + "\n\n" + "\n\n".join(sections)
 
 
 def __ensure_absolute(path: Text) -> Text:
@@ -131,7 +228,7 @@ def ensure_file_abs_path_valid(file_abs_path: Text) -> Text:
             pass
         else:
             # handle cases when directory name includes dot/hyphen/space
-            name = name.replace(" ", "_").replace(".", "_").replace("-", "_")
+            name = name.translate(__FILE_NAME_TRANS_TABLE__)
 
         path_names.append(name)
 
@@ -141,24 +238,93 @@ def ensure_file_abs_path_valid(file_abs_path: Text) -> Text:
     return new_file_path
 
 
-def __ensure_testcase_module(path: Text) -> NoReturn:
-    """ ensure pytest files are in python module, generate __init__.py on demand
+def __make_digest(data: Dict) -> Text:
+    """ make digest of pytest template render data, which includes HttpRunner version,
+        together with making source digest
+    """
+    digest = hashlib.blake2b(__MAKE_SOURCE_DIGEST__, digest_size=8)
+    digest.update(repr(data).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def __is_pytest_file_up_to_date(path: Text, digest: Text) -> bool:
+    """ check if existing pytest file is generated from the same render data,
+        only the header lines are read
+    """
+    if not os.path.isfile(path):
+        return False
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            header = [f.readline() for _ in range(3)]
+    except UnicodeDecodeError:
+        return False
+
+    return header[2] == f"# DIGEST: {digest}\n"
+
+
+def __is_same_file_content(path1: Text, path2: Text) -> bool:
+    if os.path.getsize(path1) != os.path.getsize(path2):
+        return False
+
+    with open(path1, "rb") as f1, open(path2, "rb") as f2:
+        return f1.read() == f2.read()
+
+
+def __write_file_atomically(path: Text, chunks: Iterable[Text]) -> bool:
+    """ write text chunks to a temporary file and then rename it to target path,
+        thus partially written file will never be imported by pytest.
+        target file is kept untouched if it already has the same content.
+
+    Returns:
+        bool: True if file is written, False if skipped
+
+    """
+    # process id in temporary file name avoids conflicts between make processes
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk.encode("utf-8"))
+
+        if os.path.isfile(path) and __is_same_file_content(tmp_path, path):
+            os.remove(tmp_path)
+            return False
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        # chunks may be rendered lazily, remove temporary file if failed or interrupted
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return True
+
+
+def __ensure_testcase_module(dir_path: Text) -> NoReturn:
+    """ ensure pytest files directory exists as python module, generate __init__.py on demand
     """
-    init_file = os.path.join(os.path.dirname(path), "__init__.py")
-    if os.path.isfile(init_file):
+    if dir_path in pytest_module_dirs_ensured_set:
         return
 
-    with open(init_file, "w", encoding="utf-8") as f:
-        f.write("# NOTICE: Generated By HttpRunner. DO NOT EDIT!\n")
+    os.makedirs(dir_path, exist_ok=True)
+    init_file = os.path.join(dir_path, "__init__.py")
+    if not os.path.isfile(init_file):
+        __write_file_atomically(
+            init_file, ["# NOTICE: Generated By HttpRunner. DO NOT EDIT!\n"]
+        )
+
+    pytest_module_dirs_ensured_set.add(dir_path)
 
 
 def convert_testcase_path(testcase_abs_path: Text) -> Tuple[Text, Text]:
     """convert single YAML/JSON testcase path to python file"""
     testcase_new_path = ensure_file_abs_path_valid(testcase_abs_path)
 
-    dir_path = os.path.dirname(testcase_new_path)
-    file_name, _ = os.path.splitext(os.path.basename(testcase_new_path))
-    testcase_python_abs_path = os.path.join(dir_path, f"{file_name}_test.py")
+    # split once, suffix is only in the last path component
+    testcase_new_path_no_ext, _ = os.path.splitext(testcase_new_path)
+    testcase_python_abs_path = f"{testcase_new_path_no_ext}_test.py"
+    file_name = os.path.basename(testcase_new_path_no_ext)
 
     # convert title case, e.g. request_with_variables => RequestWithVariables
     name_in_title_case = file_name.title().replace("_", "")
@@ -166,8 +332,31 @@ def convert_testcase_path(testcase_abs_path: Text) -> Tuple[Text, Text]:
     return testcase_python_abs_path, name_in_title_case
 
 
+def __format_with_black_in_process(*python_paths: Text) -> NoReturn:
+    """ format python files with imported black library, thus interpreter startup
+        and black import are saved for each invocation.
+        black command entry is called in order to respect project config as black cli does.
+    """
+    # format one file per call, black formats many files with a forked process pool
+    # and asyncio event loop, which is unsafe in multi-threaded hrun process
+    for python_path in python_paths:
+        try:
+            black.main([python_path], standalone_mode=False)
+        except Exception as ex:
+            logger.error(f"failed to format {python_path} with black: {ex}")
+
+
 def format_pytest_with_black(*python_paths: Text) -> NoReturn:
+    # remove duplicate paths while keeping order
+    python_paths = list(dict.fromkeys(python_paths))
+    if not python_paths:
+        return
+
     logger.info("format pytest cases with black ...")
+    if BLACK_READY:
+        __format_with_black_in_process(*python_paths)
+        return
+
     try:
         if is_support_multiprocessing() or len(python_paths) <= 1:
             subprocess.run(["black", *python_paths])
@@ -190,151 +379,173 @@ $ pip install black
         sys.exit(1)
 
 
-def make_config_chain_style(config: Dict) -> Text:
-    config_chain_style = f'Config("{config["name"]}")'
+""" optional config fields and their chain style call formats, in generated order
+"""
+__CONFIG_CHAIN_STYLE_FIELDS__ = (
+    ("base_url", ".base_url({})"),
+    ("verify", ".verify({})"),
+    ("export", ".export(*{})"),
+    ("weight", ".locust_weight({})"),
+)
 
-    if config["variables"]:
-        variables = config["variables"]
-        config_chain_style += f".variables(**{variables})"
+""" optional request fields and their chain style call formats, in generated order
+"""
+__REQUEST_CHAIN_STYLE_FIELDS__ = (
+    ("params", ".with_params(**{})"),
+    ("headers", ".with_headers(**{})"),
+    ("cookies", ".with_cookies(**{})"),
+    ("data", ".with_data({})"),
+    ("json", ".with_json({})"),
+    ("timeout", ".set_timeout({})"),
+    ("verify", ".set_verify({})"),
+    ("allow_redirects", ".set_allow_redirects({})"),
+    ("upload", ".upload(**{})"),
+)
 
-    if "base_url" in config:
-        config_chain_style += f'.base_url("{config["base_url"]}")'
 
-    if "verify" in config:
-        config_chain_style += f'.verify({config["verify"]})'
+def __quote_text(text: Any) -> Text:
+    """ quote text as python string literal, double quotes are preferred as black does.
+        non-text value is converted to text, e.g. name: 123 in YAML => "123"
 
-    if "export" in config:
-        config_chain_style += f'.export(*{config["export"]})'
+    e.g. body."user-agent" => 'body."user-agent"'
 
-    if "weight" in config:
-        config_chain_style += f'.locust_weight({config["weight"]})'
+    """
+    text = str(text)
+    if '"' in text:
+        return repr(text)
 
-    return config_chain_style
+    return f'"{repr(text)[1:-1]}"'
 
 
-def make_request_chain_style(request: Dict) -> Text:
-    method = request["method"].lower()
-    url = request["url"]
-    request_chain_style = f'.{method}("{url}")'
+def __make_python_literal(value: Any) -> Text:
+    """ make python literal source of value, raise TestCaseFormatError early if the
+        value could not be evaluated back in generated pytest file
+    """
+    if isinstance(value, Text):
+        return __quote_text(value)
 
-    if "params" in request:
-        params = request["params"]
-        request_chain_style += f".with_params(**{params})"
+    literal = repr(value)
+    try:
+        ast.literal_eval(literal)
+    except (ValueError, SyntaxError):
+        raise exceptions.TestCaseFormatError(
+            f"Invalid value, python literal required: {literal}"
+        )
 
-    if "headers" in request:
-        headers = request["headers"]
-        request_chain_style += f".with_headers(**{headers})"
+    return literal
 
-    if "cookies" in request:
-        cookies = request["cookies"]
-        request_chain_style += f".with_cookies(**{cookies})"
 
-    if "data" in request:
-        data = request["data"]
-        if isinstance(data, Text):
-            data = f'"{data}"'
-        request_chain_style += f".with_data({data})"
+def __make_chain_style_calls(content: Dict, fields: Tuple) -> List[Text]:
+    """ make chain style calls for fields existed in content, text value will be quoted
+    """
+    calls = []
+    for key, call_format in fields:
+        if key not in content:
+            continue
 
-    if "json" in request:
-        req_json = request["json"]
-        if isinstance(req_json, Text):
-            req_json = f'"{req_json}"'
-        request_chain_style += f".with_json({req_json})"
+        calls.append(call_format.format(__make_python_literal(content[key])))
 
-    if "timeout" in request:
-        timeout = request["timeout"]
-        request_chain_style += f".set_timeout({timeout})"
+    return calls
 
-    if "verify" in request:
-        verify = request["verify"]
-        request_chain_style += f".set_verify({verify})"
 
-    if "allow_redirects" in request:
-        allow_redirects = request["allow_redirects"]
-        request_chain_style += f".set_allow_redirects({allow_redirects})"
+def make_config_chain_style(config: Dict) -> Text:
+    config_chain_style = [f'Config({__quote_text(config["name"])})']
 
-    if "upload" in request:
-        upload = request["upload"]
-        request_chain_style += f".upload(**{upload})"
+    if config["variables"]:
+        variables = __make_python_literal(config["variables"])
+        config_chain_style.append(f".variables(**{variables})")
 
-    return request_chain_style
+    config_chain_style.extend(
+        __make_chain_style_calls(config, __CONFIG_CHAIN_STYLE_FIELDS__)
+    )
+    return "".join(config_chain_style)
+
+
+def make_request_chain_style(request: Dict) -> Text:
+    method = request["method"].lower()
+    url = __quote_text(request["url"])
+    request_chain_style = [f".{method}({url})"]
+    request_chain_style.extend(
+        __make_chain_style_calls(request, __REQUEST_CHAIN_STYLE_FIELDS__)
+    )
+    return "".join(request_chain_style)
 
 
 def make_teststep_chain_style(teststep: Dict) -> Text:
-    if teststep.get("request"):
-        step_info = f'RunRequest("{teststep["name"]}")'
-    elif teststep.get("testcase"):
-        step_info = f'RunTestCase("{teststep["name"]}")'
+    request = teststep.get("request")
+    testcase = teststep.get("testcase")
+    if request:
+        step_info = [f'RunRequest({__quote_text(teststep["name"])})']
+    elif testcase:
+        step_info = [f'RunTestCase({__quote_text(teststep["name"])})']
     else:
         raise exceptions.TestCaseFormatError(f"Invalid teststep: {teststep}")
 
     if "variables" in teststep:
-        variables = teststep["variables"]
-        step_info += f".with_variables(**{variables})"
+        variables = __make_python_literal(teststep["variables"])
+        step_info.append(f".with_variables(**{variables})")
 
     if "setup_hooks" in teststep:
         setup_hooks = teststep["setup_hooks"]
         for hook in setup_hooks:
             if isinstance(hook, Text):
-                step_info += f'.setup_hook("{hook}")'
+                step_info.append(f".setup_hook({__quote_text(hook)})")
             elif isinstance(hook, Dict) and len(hook) == 1:
                 assign_var_name, hook_content = list(hook.items())[0]
-                step_info += f'.setup_hook("{hook}", "{assign_var_name}")'
+                hook_content = __make_python_literal(hook_content)
+                assign_var_name = __quote_text(assign_var_name)
+                step_info.append(f".setup_hook({hook_content}, {assign_var_name})")
             else:
                 raise exceptions.TestCaseFormatError(f"Invalid setup hook: {hook}")
 
-    if teststep.get("request"):
-        step_info += make_request_chain_style(teststep["request"])
-    elif teststep.get("testcase"):
-        testcase = teststep["testcase"]
-        call_ref_testcase = f".call({testcase})"
-        step_info += call_ref_testcase
+    if request:
+        step_info.append(make_request_chain_style(request))
+    elif testcase:
+        step_info.append(f".call({testcase})")
 
     if "teardown_hooks" in teststep:
         teardown_hooks = teststep["teardown_hooks"]
         for hook in teardown_hooks:
             if isinstance(hook, Text):
-                step_info += f'.teardown_hook("{hook}")'
+                step_info.append(f".teardown_hook({__quote_text(hook)})")
             elif isinstance(hook, Dict) and len(hook) == 1:
                 assign_var_name, hook_content = list(hook.items())[0]
-                step_info += f'.teardown_hook("{hook}", "{assign_var_name}")'
+                hook_content = __make_python_literal(hook_content)
+                assign_var_name = __quote_text(assign_var_name)
+                step_info.append(f".teardown_hook({hook_content}, {assign_var_name})")
             else:
                 raise exceptions.TestCaseFormatError(f"Invalid teardown hook: {hook}")
 
     if "extract" in teststep:
         # request step
-        step_info += ".extract()"
+        step_info.append(".extract()")
         for extract_name, extract_path in teststep["extract"].items():
-            step_info += f""".with_jmespath('{extract_path}', '{extract_name}')"""
+            extract_path, extract_name = str(extract_path), str(extract_name)
+            step_info.append(f".with_jmespath({extract_path!r}, {extract_name!r})")
 
     if "export" in teststep:
         # reference testcase step
-        export: List[Text] = teststep["export"]
-        step_info += f".export(*{export})"
+        export = __make_python_literal(teststep["export"])
+        step_info.append(f".export(*{export})")
 
     if "validate" in teststep:
-        step_info += ".validate()"
+        step_info.append(".validate()")
 
         for v in teststep["validate"]:
             validator = uniform_validator(v)
             assert_method = validator["assert"]
-            check = validator["check"]
-            if '"' in check:
-                # e.g. body."user-agent" => 'body."user-agent"'
-                check = f"'{check}'"
-            else:
-                check = f'"{check}"'
-            expect = validator["expect"]
-            if isinstance(expect, Text):
-                expect = f'"{expect}"'
+            check = __quote_text(validator["check"])
+            expect = __make_python_literal(validator["expect"])
 
             message = validator["message"]
             if message:
-                step_info += f".assert_{assert_method}({check}, {expect}, '{message}')"
+                step_info.append(
+                    f".assert_{assert_method}({check}, {expect}, {str(message)!r})"
+                )
             else:
-                step_info += f".assert_{assert_method}({check}, {expect})"
+                step_info.append(f".assert_{assert_method}({check}, {expect})")
 
-    return f"Step({step_info})"
+    return f"Step({''.join(step_info)})"
 
 
 def make_testcase(testcase: Dict, dir_path: Text = None) -> Text:
@@ -367,7 +578,8 @@ def make_testcase(testcase: Dict, dir_path: Text = None) -> Text:
     )
 
     # prepare reference testcase
-    imports_list = []
+    # ref testcase pytest file path => import expression, insertion ordered
+    imports_mapping: Dict[Text, Text] = {}
     teststeps = testcase["teststeps"]
     for teststep in teststeps:
         if not teststep.get("testcase"):
@@ -375,40 +587,57 @@ def make_testcase(testcase: Dict, dir_path: Text = None) -> Text:
 
         # make ref testcase pytest file
         ref_testcase_path = __ensure_absolute(teststep["testcase"])
-        test_content = load_test_file(ref_testcase_path)
-
-        if not isinstance(test_content, Dict):
-            raise exceptions.TestCaseFormatError(f"Invalid teststep: {teststep}")
-
-        # api in v2 format, convert to v3 testcase
-        if "request" in test_content and "name" in test_content:
-            test_content = ensure_testcase_v3_api(test_content)
-
-        test_content.setdefault("config", {})["path"] = ref_testcase_path
-        ref_testcase_python_abs_path = make_testcase(test_content)
+        # resolve symlinks, avoid making the same ref testcase via different paths
+        ref_testcase_real_path = os.path.realpath(ref_testcase_path)
+        ref_testcase_made = ref_testcases_made_cache_mapping.get(ref_testcase_real_path)
+        if ref_testcase_made:
+            (
+                ref_testcase_python_abs_path,
+                ref_testcase_cls_name,
+                ref_testcase_export,
+            ) = ref_testcase_made
+        else:
+            test_content = load_test_file(ref_testcase_path)
+
+            if not isinstance(test_content, Dict):
+                raise exceptions.TestCaseFormatError(f"Invalid teststep: {teststep}")
+
+            # api in v2 format, convert to v3 testcase
+            if "request" in test_content and "name" in test_content:
+                test_content = ensure_testcase_v3_api(test_content)
+
+            test_content.setdefault("config", {})["path"] = ref_testcase_path
+            ref_testcase_python_abs_path = make_testcase(test_content)
+            ref_testcase_cls_name = pytest_files_made_cache_mapping[
+                ref_testcase_python_abs_path
+            ]
+            ref_testcase_export: List = test_content["config"].get("export", [])
+            ref_testcases_made_cache_mapping[ref_testcase_real_path] = (
+                ref_testcase_python_abs_path,
+                ref_testcase_cls_name,
+                ref_testcase_export,
+            )
 
         # override testcase export
-        ref_testcase_export: List = test_content["config"].get("export", [])
         if ref_testcase_export:
             step_export: List = teststep.setdefault("export", [])
             step_export.extend(ref_testcase_export)
-            teststep["export"] = list(set(step_export))
+            # sort to keep generated content stable, set order varies between processes
+            teststep["export"] = sorted(set(step_export))
 
-        # prepare ref testcase class name
-        ref_testcase_cls_name = pytest_files_made_cache_mapping[
-            ref_testcase_python_abs_path
-        ]
         teststep["testcase"] = ref_testcase_cls_name
 
-        # prepare import ref testcase
+        # prepare import ref testcase, only once for each ref testcase
+        if ref_testcase_python_abs_path in imports_mapping:
+            continue
+
         ref_testcase_python_relative_path = convert_relative_project_root_dir(
             ref_testcase_python_abs_path
         )
         ref_module_name, _ = os.path.splitext(ref_testcase_python_relative_path)
         ref_module_name = ref_module_name.replace(os.sep, ".")
         import_expr = f"from {ref_module_name} import TestCase{ref_testcase_cls_name} as {ref_testcase_cls_name}"
-        if import_expr not in imports_list:
-            imports_list.append(import_expr)
+        imports_mapping[ref_testcase_python_abs_path] = import_expr
 
     testcase_path = convert_relative_project_root_dir(testcase_abs_path)
     # current file compared to ProjectRootDir
@@ -419,25 +648,33 @@ def make_testcase(testcase: Dict, dir_path: Text = None) -> Text:
         "testcase_path": testcase_path,
         "diff_levels": diff_levels,
         "class_name": f"TestCase{testcase_cls_name}",
-        "imports_list": imports_list,
+        "imports_list": list(imports_mapping.values()),
         "config_chain_style": make_config_chain_style(config),
         "parameters": config.get("parameters"),
         "teststeps_chain_style": [
             make_teststep_chain_style(step) for step in teststeps
         ],
     }
-    content = __TEMPLATE__.render(data)
+    __ensure_testcase_module(os.path.dirname(testcase_python_abs_path))
+
+    digest = __make_digest(data)
+    if __is_pytest_file_up_to_date(testcase_python_abs_path, digest):
+        pytest_files_made_cache_mapping[testcase_python_abs_path] = testcase_cls_name
+        logger.info(f"testcase is up to date: {testcase_python_abs_path}")
+        return testcase_python_abs_path
 
-    # ensure new file's directory exists
-    dir_path = os.path.dirname(testcase_python_abs_path)
-    if not os.path.exists(dir_path):
-        os.makedirs(dir_path)
+    data["digest"] = digest
 
-    with open(testcase_python_abs_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    # stream rendered content to file, avoid holding whole file content in memory
+    template_stream = __TEMPLATE__.stream(data)
+    template_stream.enable_buffering()
+    if __write_file_atomically(
+        testcase_python_abs_path,
+        itertools.chain([__make_pytest_header(data)], template_stream),
+    ):
+        pytest_files_written_set.add(testcase_python_abs_path)
 
     pytest_files_made_cache_mapping[testcase_python_abs_path] = testcase_cls_name
-    __ensure_testcase_module(testcase_python_abs_path)
 
     logger.info(f"generated testcase: {testcase_python_abs_path}")
 
@@ -501,109 +738,203 @@ def make_testsuite(testsuite: Dict) -> NoReturn:
         pytest_files_run_set.add(testcase_pytest_path)
 
 
-def __make(tests_path: Text) -> NoReturn:
+def __make_test_file(test_file: Text) -> NoReturn:
+    """ make single YAML/JSON testcase/testsuite file,
+        generated pytest file path will be cached in pytest_files_made_cache_mapping
+    """
+    try:
+        test_content = load_test_file(test_file)
+    except (exceptions.FileNotFound, exceptions.FileFormatError) as ex:
+        logger.warning(f"Invalid test file: {test_file}\n{type(ex).__name__}: {ex}")
+        return
+
+    if not isinstance(test_content, Dict):
+        logger.warning(
+            f"Invalid test file: {test_file}\n"
+            f"reason: test content not in dict format."
+        )
+        return
+
+    # api in v2 format, convert to v3 testcase
+    if "request" in test_content and "name" in test_content:
+        test_content = ensure_testcase_v3_api(test_content)
+
+    if "config" not in test_content:
+        logger.warning(
+            f"Invalid testcase/testsuite file: {test_file}\n"
+            f"reason: missing config part."
+        )
+        return
+    elif not isinstance(test_content["config"], Dict):
+        logger.warning(
+            f"Invalid testcase/testsuite file: {test_file}\n"
+            f"reason: config should be dict type, got {test_content['config']}"
+        )
+        return
+
+    # ensure path absolute
+    test_content.setdefault("config", {})["path"] = test_file
+
+    # testcase
+    if "teststeps" in test_content:
+        try:
+            testcase_pytest_path = make_testcase(test_content)
+            pytest_files_run_set.add(testcase_pytest_path)
+        except exceptions.TestCaseFormatError as ex:
+            logger.warning(
+                f"Invalid testcase file: {test_file}\n{type(ex).__name__}: {ex}"
+            )
+
+    # testsuite
+    elif "testcases" in test_content:
+        try:
+            make_testsuite(test_content)
+        except exceptions.TestSuiteFormatError as ex:
+            logger.warning(
+                f"Invalid testsuite file: {test_file}\n{type(ex).__name__}: {ex}"
+            )
+
+    # invalid format
+    else:
+        logger.warning(
+            f"Invalid test file: {test_file}\n"
+            f"reason: file content is neither testcase nor testsuite"
+        )
+
+
+def __make_test_file_in_worker(
+    test_file: Text,
+) -> Tuple[Dict[Text, Text], List[Text], List[Text]]:
+    """ make single test file in worker process,
+        return pytest files newly made, to run and written, which will be merged in main process
+    """
+    made_before = set(pytest_files_made_cache_mapping)
+    run_before = set(pytest_files_run_set)
+    written_before = set(pytest_files_written_set)
+
+    __make_test_file(test_file)
+
+    made_mapping = {
+        path: cls_name
+        for path, cls_name in pytest_files_made_cache_mapping.items()
+        if path not in made_before
+    }
+    return (
+        made_mapping,
+        list(pytest_files_run_set - run_before),
+        list(pytest_files_written_set - written_before),
+    )
+
+
+def __make_in_parallel(
+    test_files: Iterable[Text], workers: int, chunksize: int = 1
+) -> NoReturn:
+    """ make test files with process pool, each file is loaded, rendered and written independently.
+        referenced testcases may be made in several workers, which generates identical files.
+        files are submitted as they are iterated, thus workers start during folder traversal.
+    """
+    logger.info(f"make files with {workers} processes")
+    # spawn workers instead of forking, main process may have started threads,
+    # e.g. sentry transport, forking a multi-threaded process risks deadlocks
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        for made_mapping, run_files, written_files in executor.map(
+            __make_test_file_in_worker, test_files, chunksize=chunksize
+        ):
+            pytest_files_made_cache_mapping.update(made_mapping)
+            pytest_files_run_set.update(run_files)
+            pytest_files_written_set.update(written_files)
+
+
+def __iter_yaml_json_files(test_files: Iterable[Text]) -> Iterable[Text]:
+    """ iterate YAML/JSON test files, pytest files are saved to run directly
+    """
+    for test_file in test_files:
+        if test_file.lower().endswith("_test.py"):
+            pytest_files_run_set.add(test_file)
+        else:
+            yield test_file
+
+
+def __make(tests_path: Text, workers: int = 1) -> NoReturn:
     """ make testcase(s) with testcase/testsuite/folder absolute path
         generated pytest file path will be cached in pytest_files_made_cache_mapping
 
     Args:
         tests_path: should be in absolute path
+        workers: max number of processes to make folder files in parallel
 
     """
     logger.info(f"make path: {tests_path}")
-    test_files = []
     if os.path.isdir(tests_path):
-        files_list = load_folder_files(tests_path)
-        test_files.extend(files_list)
+        # iterate folder files lazily, avoid collecting all files in advance
+        test_files = iter_folder_files(tests_path)
     elif os.path.isfile(tests_path):
-        test_files.append(tests_path)
+        test_files = [tests_path]
     else:
         raise exceptions.TestcaseNotFound(f"Invalid tests path: {tests_path}")
 
-    for test_file in test_files:
-        if test_file.lower().endswith("_test.py"):
-            pytest_files_run_set.add(test_file)
-            continue
-
-        try:
-            test_content = load_test_file(test_file)
-        except (exceptions.FileNotFound, exceptions.FileFormatError) as ex:
-            logger.warning(f"Invalid test file: {test_file}\n{type(ex).__name__}: {ex}")
-            continue
+    yaml_json_files = __iter_yaml_json_files(test_files)
 
-        if not isinstance(test_content, Dict):
-            logger.warning(
-                f"Invalid test file: {test_file}\n"
-                f"reason: test content not in dict format."
-            )
-            continue
+    workers = min(workers, os.cpu_count() or 1)
+    # process pool with mp_context requires python 3.7+
+    if workers > 1 and sys.version_info >= (3, 7):
+        # buffer files only until every worker gets enough files
+        buffered_files = list(
+            itertools.islice(yaml_json_files, workers * MIN_FILES_PER_MAKE_WORKER)
+        )
+        workers = min(workers, len(buffered_files) // MIN_FILES_PER_MAKE_WORKER)
+        yaml_json_files = itertools.chain(buffered_files, yaml_json_files)
+        if workers > 1 and is_support_multiprocessing():
+            # batch files to save IPC round trips, total count is unknown while iterating
+            chunksize = max(1, len(buffered_files) // (4 * workers))
+            __make_in_parallel(yaml_json_files, workers, chunksize)
+            return
 
-        # api in v2 format, convert to v3 testcase
-        if "request" in test_content and "name" in test_content:
-            test_content = ensure_testcase_v3_api(test_content)
+    # make files sequentially as they are found
+    for test_file in yaml_json_files:
+        __make_test_file(test_file)
 
-        if "config" not in test_content:
-            logger.warning(
-                f"Invalid testcase/testsuite file: {test_file}\n"
-                f"reason: missing config part."
-            )
-            continue
-        elif not isinstance(test_content["config"], Dict):
-            logger.warning(
-                f"Invalid testcase/testsuite file: {test_file}\n"
-                f"reason: config should be dict type, got {test_content['config']}"
-            )
-            continue
 
-        # ensure path absolute
-        test_content.setdefault("config", {})["path"] = test_file
-
-        # testcase
-        if "teststeps" in test_content:
-            try:
-                testcase_pytest_path = make_testcase(test_content)
-                pytest_files_run_set.add(testcase_pytest_path)
-            except exceptions.TestCaseFormatError as ex:
-                logger.warning(
-                    f"Invalid testcase file: {test_file}\n{type(ex).__name__}: {ex}"
-                )
-                continue
-
-        # testsuite
-        elif "testcases" in test_content:
-            try:
-                make_testsuite(test_content)
-            except exceptions.TestSuiteFormatError as ex:
-                logger.warning(
-                    f"Invalid testsuite file: {test_file}\n{type(ex).__name__}: {ex}"
-                )
-                continue
+def main_make(tests_paths: List[Text], workers: int = 1) -> List[Text]:
+    """ make YAML/JSON testcases/testsuites to pytest files
 
-        # invalid format
-        else:
-            logger.warning(
-                f"Invalid test file: {test_file}\n"
-                f"reason: file content is neither testcase nor testsuite"
-            )
+    Args:
+        tests_paths: testcase/testsuite/folder paths
+        workers: max number of processes to make large folders in parallel,
+            requires caller's main module to be guarded by if __name__ == "__main__"
 
+    Returns:
+        pytest files to run
 
-def main_make(tests_paths: List[Text]) -> List[Text]:
+    """
     if not tests_paths:
         return []
 
+    # caches are scoped to one making run, avoid leaking files made in previous runs
+    # clear in place because callers may hold references to these containers
+    pytest_files_made_cache_mapping.clear()
+    pytest_files_run_set.clear()
+    pytest_files_written_set.clear()
+    ref_testcases_made_cache_mapping.clear()
+    pytest_module_dirs_ensured_set.clear()
+
+    # working directory does not change during making
+    cwd = os.getcwd()
     for tests_path in tests_paths:
         tests_path = ensure_path_sep(tests_path)
         if not os.path.isabs(tests_path):
-            tests_path = os.path.join(os.getcwd(), tests_path)
+            tests_path = os.path.join(cwd, tests_path)
 
         try:
-            __make(tests_path)
+            __make(tests_path, workers)
         except exceptions.MyBaseError as ex:
             logger.error(ex)
             sys.exit(1)
 
-    # format pytest files
-    pytest_files_format_list = pytest_files_made_cache_mapping.keys()
-    format_pytest_with_black(*pytest_files_format_list)
+    # format pytest files written in this run, up to date files were formatted before
+    if pytest_files_written_set:
+        format_pytest_with_black(*pytest_files_written_set)
 
     return list(pytest_files_run_set)
 
@@ -617,5 +948,11 @@ def init_make_parser(subparsers):
     parser.add_argument(
         "testcase_path", nargs="*", help="Specify YAML/JSON testcase file/folder path"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Specify max number of processes to make large folders in parallel",
+    )
 
     return parser
@@ -13,6 +13,32 @@ class TestLoader(unittest.TestCase):
         )
         self.assertEqual(len(testcase_obj.teststeps), 4)
 
+    def test_load_test_file_with_cache(self):
+        path = "examples/postman_echo/request_methods/request_with_variables.yml"
+        content1 = loader.load_test_file(path)
+        content2 = loader.load_test_file(path)
+        self.assertEqual(content1, content2)
+        self.assertIsNot(content1, content2)
+
+        # modifying loaded content should not pollute cache
+        content1["config"]["path"] = path
+        content3 = loader.load_test_file(path)
+        self.assertNotIn("path", content3["config"])
+
+        # file changes should invalidate cache
+        yaml_tmp_file = "tmp.yml"
+        with open(yaml_tmp_file, "w") as f:
+            f.write("a: 1\n")
+        self.assertEqual(loader.load_test_file(yaml_tmp_file), {"a": 1})
+
+        with open(yaml_tmp_file, "w") as f:
+            f.write("a: 2\n")
+        mtime_ns = os.stat(yaml_tmp_file).st_mtime_ns + 1
+        os.utime(yaml_tmp_file, ns=(mtime_ns, mtime_ns))
+        self.assertEqual(loader.load_test_file(yaml_tmp_file), {"a": 2})
+
+        os.remove(yaml_tmp_file)
+
     def test_load_json_file_file_format_error(self):
         json_tmp_file = "tmp.json"
         # create empty file
@@ -87,6 +113,22 @@ class TestLoader(unittest.TestCase):
         files = loader.load_folder_files(file2, recursive=False)
         self.assertEqual([], files)
 
+    def test_iter_folder_files(self):
+        folder = os.path.join(os.getcwd(), "examples")
+        file1 = os.path.join(os.getcwd(), "examples", "httpbin", "hooks.yml")
+        file2 = os.path.join(os.getcwd(), "examples", "httpbin", "hooks_test.py")
+        file3 = os.path.join(os.getcwd(), "examples", "httpbin", "debugtalk.py")
+
+        files_iter = loader.iter_folder_files(folder)
+        self.assertNotIsInstance(files_iter, list)
+
+        files = list(files_iter)
+        self.assertIn(file1, files)
+        self.assertIn(file2, files)
+        self.assertNotIn(file3, files)
+
+        self.assertEqual(list(loader.iter_folder_files("not_existed_folder")), [])
+
     def test_load_custom_dot_env_file(self):
         dot_env_path = os.path.join(os.getcwd(), "examples", "httpbin", "test.env")
         env_variables_mapping = loader.load_dot_env_file(dot_env_path)
@@ -1,15 +1,23 @@
+import asyncio
+import datetime
+import json
 import os
+import shutil
+import tempfile
 import unittest
+from unittest import mock
 
-from httprunner import loader
+from httprunner import exceptions, loader, make
 from httprunner.make import (
     main_make,
     convert_testcase_path,
     pytest_files_made_cache_mapping,
     make_config_chain_style,
     make_teststep_chain_style,
+    make_request_chain_style,
     pytest_files_run_set,
     ensure_file_abs_path_valid,
+    format_pytest_with_black,
 )
 
 
@@ -75,6 +83,75 @@ from request_methods.request_with_functions_test import (
                 ".call(RequestWithFunctions)", content,
             )
 
+    def test_make_testcase_with_ref_cached(self):
+        path = os.path.join(
+            os.getcwd(),
+            "examples",
+            "postman_echo",
+            "request_methods",
+            "request_with_testcase_reference.yml",
+        )
+        main_make([path])
+
+        # made mapping is cleared while ref testcases cache is kept
+        pytest_files_made_cache_mapping.clear()
+        pytest_files_run_set.clear()
+        testcase = loader.load_test_file(path)
+        testcase["config"]["path"] = path
+        testcase_python_path = make.make_testcase(testcase)
+
+        with open(testcase_python_path) as f:
+            self.assertIn(".call(RequestWithFunctions)", f.read())
+
+    def test_make_testcase_repeatedly(self):
+        main_make(["examples/postman_echo/request_methods/request_with_functions.yml"])
+        testcase_python_list = main_make(
+            ["examples/postman_echo/request_methods/request_with_variables.yml"]
+        )
+        self.assertEqual(
+            testcase_python_list,
+            [
+                os.path.join(
+                    os.getcwd(),
+                    os.path.join(
+                        "examples",
+                        "postman_echo",
+                        "request_methods",
+                        "request_with_variables_test.py",
+                    ),
+                )
+            ],
+        )
+        self.assertEqual(len(pytest_files_made_cache_mapping), 1)
+
+    def test_make_testcase_up_to_date(self):
+        path = ["examples/postman_echo/request_methods/request_with_variables.yml"]
+        testcase_python_path = main_make(path)[0]
+        with open(testcase_python_path) as f:
+            self.assertTrue(f.read().splitlines()[2].startswith("# DIGEST: "))
+        mtime_ns = os.stat(testcase_python_path).st_mtime_ns
+
+        loader.project_meta = None
+        with mock.patch.object(make, "format_pytest_with_black") as mock_format:
+            self.assertEqual(main_make(path), [testcase_python_path])
+            mock_format.assert_not_called()
+        self.assertEqual(os.stat(testcase_python_path).st_mtime_ns, mtime_ns)
+
+        # changing making source invalidates generated file
+        loader.project_meta = None
+        with mock.patch.object(make, "__MAKE_SOURCE_DIGEST__", b"changed"):
+            with mock.patch.object(make, "format_pytest_with_black") as mock_format:
+                main_make(path)
+                mock_format.assert_called_once_with(testcase_python_path)
+
+        # existing file not in utf-8 encoding is not up to date
+        with open(testcase_python_path, "wb") as f:
+            f.write(b"# \xff\xfe\n" * 3)
+        loader.project_meta = None
+        main_make(path)
+        with open(testcase_python_path) as f:
+            self.assertTrue(f.read().splitlines()[2].startswith("# DIGEST: "))
+
     def test_make_testcase_folder(self):
         path = ["examples/postman_echo/request_methods/"]
         testcase_python_list = main_make(path)
@@ -91,6 +168,173 @@ from request_methods.request_with_functions_test import (
             testcase_python_list,
         )
 
+    def test_make_testcase_folder_in_parallel(self):
+        path = ["examples/postman_echo/request_methods/"]
+
+        def read_made_files():
+            made_files = {}
+            for made_path in pytest_files_made_cache_mapping:
+                with open(made_path) as f:
+                    made_files[made_path] = f.read()
+            return made_files
+
+        # process pool is opt-in
+        with mock.patch.object(make, "MIN_FILES_PER_MAKE_WORKER", 1):
+            with mock.patch("os.cpu_count", return_value=2):
+                with mock.patch.object(make, "__make_in_parallel") as mock_parallel:
+                    sequential_python_list = main_make(path)
+                    mock_parallel.assert_not_called()
+        sequential_made_mapping = dict(pytest_files_made_cache_mapping)
+        sequential_made_files = read_made_files()
+        # remove made files, ensure they are generated again
+        for made_path in sequential_made_files:
+            os.remove(made_path)
+
+        loader.project_meta = None
+        with mock.patch.object(make, "MIN_FILES_PER_MAKE_WORKER", 1):
+            with mock.patch("os.cpu_count", return_value=2):
+                testcase_python_list = main_make(path, workers=2)
+
+        # referenced testcase is made in several workers, result should be the same
+        self.assertEqual(sorted(testcase_python_list), sorted(sequential_python_list))
+        self.assertEqual(pytest_files_made_cache_mapping, sequential_made_mapping)
+        self.assertEqual(read_made_files(), sequential_made_files)
+
+        self.assertIn(
+            os.path.join(
+                os.getcwd(),
+                os.path.join(
+                    "examples",
+                    "postman_echo",
+                    "request_methods",
+                    "request_with_testcase_reference_test.py",
+                ),
+            ),
+            testcase_python_list,
+        )
+        self.assertIn(
+            os.path.join(
+                os.getcwd(),
+                os.path.join(
+                    "examples",
+                    "postman_echo",
+                    "request_methods",
+                    "request_with_functions_test.py",
+                ),
+            ),
+            pytest_files_made_cache_mapping,
+        )
+
+    def test_write_file_atomically_failed(self):
+        write_file_atomically = getattr(make, "__write_file_atomically")
+
+        def chunks():
+            yield "# first chunk\n"
+            raise ValueError("render failed")
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, "a_test.py")
+            with self.assertRaises(ValueError):
+                write_file_atomically(path, chunks())
+            self.assertEqual(os.listdir(dir_path), [])
+
+            self.assertTrue(write_file_atomically(path, ["# content\n"]))
+            self.assertFalse(write_file_atomically(path, ["# content\n"]))
+            self.assertEqual(os.listdir(dir_path), ["a_test.py"])
+
+    def test_format_pytest_with_black_project_config(self):
+        with tempfile.TemporaryDirectory() as project_dir:
+            with open(os.path.join(project_dir, "pyproject.toml"), "w") as f:
+                f.write("[tool.black]\nline-length = 40\n")
+
+            python_paths = []
+            for name in ["a_test.py", "b_test.py"]:
+                python_path = os.path.join(project_dir, name)
+                with open(python_path, "w") as f:
+                    f.write(
+                        'x = {"aaaaaaaaa": 1, "bbbbbbbbbbbbb": 2, "ccccccccc": 3}\n'
+                    )
+                python_paths.append(python_path)
+
+            # format many files repeatedly, caller's event loop is kept
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                format_pytest_with_black(*python_paths)
+                format_pytest_with_black(*python_paths)
+                self.assertIs(asyncio.get_event_loop_policy().get_event_loop(), loop)
+                self.assertFalse(loop.is_closed())
+            finally:
+                asyncio.set_event_loop(None)
+                loop.close()
+
+            for python_path in python_paths:
+                with open(python_path) as f:
+                    self.assertEqual(
+                        f.read(),
+                        'x = {\n    "aaaaaaaaa": 1,\n    "bbbbbbbbbbbbb": 2,\n    "ccccccccc": 3,\n}\n',
+                    )
+
+    def test_make_testcase_folder_while_iterating(self):
+        folder = os.path.join(
+            os.getcwd(), "examples", "postman_echo", "request_methods"
+        )
+        file1 = os.path.join(folder, "request_with_variables.yml")
+        file2 = os.path.join(folder, "request_with_functions.yml")
+
+        def iter_folder_files(folder_path):
+            yield file1
+            # first file is made before traversal continues
+            self.assertIn(
+                os.path.join(folder, "request_with_variables_test.py"),
+                pytest_files_made_cache_mapping,
+            )
+            yield file2
+
+        with mock.patch.object(make, "iter_folder_files", iter_folder_files):
+            testcase_python_list = main_make([folder])
+
+        self.assertEqual(len(testcase_python_list), 2)
+
+    def test_make_testcase_with_numeric_names(self):
+        self.assertEqual(
+            make_config_chain_style({"name": 123, "variables": {}}), 'Config("123")'
+        )
+        self.assertEqual(
+            make_teststep_chain_style(
+                {"name": 456, "request": {"method": "GET", "url": "/get"}}
+            ),
+            'Step(RunRequest("456").get("/get"))',
+        )
+
+        json_file = os.path.join("tests", "data", "a-b.c", "numeric_names.json")
+        made_dir = os.path.join("tests", "data", "a_b_c")
+        made_dir_existed = os.path.isdir(made_dir)
+        with open(json_file, "w") as f:
+            json.dump(
+                {
+                    "config": {"name": 123},
+                    "teststeps": [
+                        {"name": 456, "request": {"method": "GET", "url": "/get"}}
+                    ],
+                },
+                f,
+            )
+
+        try:
+            testcase_python_list = main_make([json_file])
+            with open(testcase_python_list[0]) as f:
+                content = f.read()
+            self.assertIn('Config("123")', content)
+            self.assertIn('RunRequest("456")', content)
+        finally:
+            os.remove(json_file)
+            if made_dir_existed:
+                for made_path in pytest_files_made_cache_mapping:
+                    os.remove(made_path)
+            else:
+                shutil.rmtree(made_dir)
+
     def test_ensure_file_path_valid(self):
         self.assertEqual(
             ensure_file_abs_path_valid(
@@ -246,3 +490,43 @@ from request_methods.request_with_functions_test import (
             teststep_chain_style,
             """Step(RunRequest("get with params").with_variables(**{'foo1': 'bar1', 'foo2': 123, 'sum_v': '${sum_two(1, 2)}', 'myjson': {'name': 'user', 'password': '123456'}}).get("/get").with_params(**{'foo1': '$foo1', 'foo2': '$foo2', 'sum_v': '$sum_v'}).with_headers(**{'User-Agent': 'HttpRunner/${get_httprunner_version()}'}).with_json("$myjson").extract().with_jmespath('body.args.foo1', 'session_foo1').with_jmespath('body.args.foo2', 'session_foo2').validate().assert_equal("status_code", 200).assert_equal("body.args.sum_v", "3"))""",
         )
+
+    def test_make_request_chain_style(self):
+        request = {
+            "method": "POST",
+            "url": "/post",
+            "timeout": 5,
+            "data": "abc",
+            "headers": {"Content-Type": "text/plain"},
+            "verify": False,
+        }
+        self.assertEqual(
+            make_request_chain_style(request),
+            """.post("/post").with_headers(**{'Content-Type': 'text/plain'}).with_data("abc").set_timeout(5).set_verify(False)""",
+        )
+
+    def test_make_chain_style_with_quotes(self):
+        request = {
+            "method": "GET",
+            "url": '/get?q="a\\b"',
+            "data": "it's",
+        }
+        self.assertEqual(
+            make_request_chain_style(request),
+            """.get('/get?q="a\\\\b"').with_data("it's")""",
+        )
+
+        teststep = {
+            "name": 'get "foo"',
+            "request": {"method": "GET", "url": "/get"},
+            "setup_hooks": [{"resp": "${setup_hook()}"}],
+            "validate": [{"eq": ["body.msg", 'it\'s "ok"', "msg 'x'"]}],
+        }
+        self.assertEqual(
+            make_teststep_chain_style(teststep),
+            """Step(RunRequest('get "foo"').setup_hook("${setup_hook()}", "resp").get("/get").validate().assert_equal("body.msg", 'it\\'s "ok"', "msg 'x'"))""",
+        )
+
+        request["json"] = {"date": datetime.date(2020, 1, 1)}
+        with self.assertRaises(exceptions.TestCaseFormatError):
+            make_request_chain_style(request)